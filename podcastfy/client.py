@@ -8,6 +8,7 @@ generation, and text-to-speech conversion processes.
 import os
 import uuid
 import typer
+from concurrent.futures import ProcessPoolExecutor
 from podcastfy.content_parser.content_extractor import ContentExtractor
 from podcastfy.content_generator import ContentGenerator
 from podcastfy.text_to_speech import TextToSpeech
@@ -259,4 +260,52 @@ def generate_podcast(
 
 	except Exception as e:
 		logger.error(f"An error occurred: {str(e)}")
-		raise
\ No newline at end of file
+		raise
+
+
+def _generate_podcast_worker(kwargs: Dict[str, Any]) -> Optional[str]:
+	"""
+	Generate a single podcast from a keyword-argument dictionary.
+
+	Module-level so ProcessPoolExecutor can pickle it.
+
+	Args:
+		kwargs (Dict[str, Any]): Keyword arguments for generate_podcast.
+
+	Returns:
+		Optional[str]: Path to the final podcast audio file, or None if only generating a transcript.
+	"""
+	return generate_podcast(**kwargs)
+
+
+def generate_podcast_batch(
+	podcast_requests: List[Dict[str, Any]],
+	pool_size: Optional[int] = None
+) -> List[Optional[str]]:
+	"""
+	Generate several podcasts in parallel, one process per podcast.
+
+	Each entry in podcast_requests is a keyword-argument dictionary for
+	generate_podcast. MP3 encoding is CPU-bound and each podcast performs
+	its own TTS fan-out, so process isolation lets podcasts proceed
+	independently instead of running the batch sequentially.
+
+	Args:
+		podcast_requests (List[Dict[str, Any]]): One keyword-argument dictionary
+			per podcast, as accepted by generate_podcast. Configs must be plain
+			dictionaries so they can be pickled across processes.
+		pool_size (Optional[int]): Number of worker processes. Defaults to the
+			number of CPUs.
+
+	Returns:
+		List[Optional[str]]: Result of generate_podcast for each request, in input order.
+
+	Example:
+		>>> from podcastfy.client import generate_podcast_batch
+		>>> results = generate_podcast_batch([
+		...     {'urls': ['https://example.com/article1']},
+		...     {'urls': ['https://example.com/article2'], 'tts_model': 'elevenlabs'}
+		... ], pool_size=2)
+	"""
+	with ProcessPoolExecutor(max_workers=pool_size) as pool:
+		return list(pool.map(_generate_podcast_worker, podcast_requests))
\ No newline at end of file
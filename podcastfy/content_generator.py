@@ -7,7 +7,7 @@ provides methods to generate and save the generated content.
 """
 
 import os
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 
 #from langchain_google_vertexai import ChatVertexAI
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -51,6 +51,68 @@ class ContentGenerator:
 		
 		self.chain = (self.prompt_template | self.llm | self.parser)
 
+	def _build_prompt_params(self, input_texts: str) -> Dict[str, Any]:
+		"""
+		Build the prompt parameters dictionary for a single input text.
+
+		Args:
+			input_texts (str): Input texts to generate content from.
+
+		Returns:
+			Dict[str, Any]: Prompt parameters for the content generation chain.
+		"""
+		return {
+			"input_text": input_texts,
+			"word_count": self.config_conversation.get('word_count'),
+			"conversation_style": ", ".join(self.config_conversation.get('conversation_style', [])),
+			"roles_person1": self.config_conversation.get('roles_person1'),
+			"roles_person2": self.config_conversation.get('roles_person2'),
+			"dialogue_structure": ", ".join(self.config_conversation.get('dialogue_structure', [])),
+			"podcast_name": self.config_conversation.get('podcast_name'),
+			"podcast_tagline": self.config_conversation.get('podcast_tagline'),
+			"output_language": self.config_conversation.get('output_language'),
+			"engagement_techniques": ", ".join(self.config_conversation.get('engagement_techniques', []))
+		}
+
+	def generate_qa_content_batch(self, input_texts_list: List[str],
+								  output_filepaths: Optional[List[str]] = None) -> List[str]:
+		"""
+		Generate Q&A content for multiple input texts in one batched chain call.
+
+		chain.batch() fans the prompts out to the provider concurrently, so
+		the batch completes in roughly the wall-clock time of one request
+		instead of N sequential round-trips. The provider still receives one
+		request per input text.
+
+		Args:
+			input_texts_list (List[str]): List of input texts to generate content from.
+			output_filepaths (Optional[List[str]]): Filepaths to save each response content.
+				Must match the length of input_texts_list if provided. Defaults to None.
+
+		Returns:
+			List[str]: Formatted Q&A content for each input text, in input order.
+
+		Raises:
+			Exception: If there's an error in generating content.
+		"""
+		try:
+			prompt_params_list = [self._build_prompt_params(input_texts) for input_texts in input_texts_list]
+
+			responses = self.chain.batch(prompt_params_list)
+
+			logger.info(f"Content generated successfully for {len(responses)} inputs")
+
+			if output_filepaths:
+				for response, output_filepath in zip(responses, output_filepaths):
+					with open(output_filepath, 'w') as file:
+						file.write(response)
+					logger.info(f"Response content saved to {output_filepath}")
+
+			return responses
+		except Exception as e:
+			logger.error(f"Error generating content batch: {str(e)}")
+			raise
+
 	def generate_qa_content(self, input_texts: str, output_filepath: Optional[str] = None) -> str:
 		"""
 		Generate Q&A content based on input texts.
@@ -66,20 +128,7 @@ class ContentGenerator:
 			Exception: If there's an error in generating content.
 		"""
 		try:
-			
-			
-			prompt_params = {
-				"input_text": input_texts,
-				"word_count": self.config_conversation.get('word_count'),
-				"conversation_style": ", ".join(self.config_conversation.get('conversation_style', [])),
-				"roles_person1": self.config_conversation.get('roles_person1'),
-				"roles_person2": self.config_conversation.get('roles_person2'),
-				"dialogue_structure": ", ".join(self.config_conversation.get('dialogue_structure', [])),
-				"podcast_name": self.config_conversation.get('podcast_name'),
-				"podcast_tagline": self.config_conversation.get('podcast_tagline'),
-				"output_language": self.config_conversation.get('output_language'),
-				"engagement_techniques": ", ".join(self.config_conversation.get('engagement_techniques', []))
-			}
+			prompt_params = self._build_prompt_params(input_texts)
 
 			self.response = self.chain.invoke(prompt_params)
 			
@@ -118,12 +167,13 @@ def main(seed: int = 42) -> None:
 		content_generator = ContentGenerator(api_key)
 
 		# Read input text from file
-		input_text = ""
+		input_parts = []
 		transcript_dir = config.get('output_directories', {}).get('transcripts', 'data/transcripts')
 		for filename in os.listdir(transcript_dir):
 			if filename.endswith('.txt'):
 				with open(os.path.join(transcript_dir, filename), 'r') as file:
-					input_text += file.read() + "\n\n"
+					input_parts.append(file.read())
+		input_text = "\n\n".join(input_parts)
 
 		# Generate Q&A content
 		response = content_generator.generate_qa_content(input_text)
@@ -6,17 +6,116 @@ It supports both ElevenLabs and OpenAI TTS services and handles the conversion p
 including cleaning of input text and merging of audio files.
 """
 
+import functools
+import hashlib
+import io
+import itertools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from elevenlabs import client as elevenlabs_client
 from podcastfy.utils.config import load_config
-from pydub import AudioSegment
 import os
 import re
 import openai
-from typing import List, Tuple, Optional, Union
+from typing import Callable, Iterable, Iterator, List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _pydub_audio_segment():
+	"""
+	Import and return pydub's AudioSegment class lazily.
+
+	pydub probes for ffmpeg/avconv at import time; deferring the import
+	keeps that cost off module load for callers that never touch audio
+	(e.g. transcript-only runs).
+
+	Returns:
+		type: The pydub.AudioSegment class.
+	"""
+	from pydub import AudioSegment
+	return AudioSegment
+
+
+# Matches a Person1 dialogue followed by its Person2 reply
+_QA_PAIR_PATTERN = re.compile(r'<Person1>(.*?)</Person1>\s*<Person2>(.*?)</Person2>', re.DOTALL)
+
+# Collapses leftover empty lines after tag removal
+_EMPTY_LINES_PATTERN = re.compile(r'\n\s*\n')
+
+# List of SSML tags supported by both OpenAI and ElevenLabs
+_SUPPORTED_SSML_TAGS = [
+	'speak', 'break', 'lang', 'p', 'phoneme',
+	's', 'say-as', 'sub'
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _markup_patterns(additional_tags: Tuple[str, ...]) -> Tuple[re.Pattern, List[Tuple[re.Pattern, str]]]:
+	"""
+	Build and cache the regex patterns used to clean TSS markup.
+
+	Compiling these once per set of additional tags keeps pattern
+	construction off the per-call path of clean_tss_markup.
+
+	Args:
+		additional_tags (Tuple[str, ...]): Additional tags to preserve.
+
+	Returns:
+		Tuple[re.Pattern, List[Tuple[re.Pattern, str]]]: The unsupported-tag
+		pattern and, per additional tag, the (pattern, replacement) pair that
+		restores its closing tag.
+	"""
+	supported_tags = _SUPPORTED_SSML_TAGS + list(additional_tags)
+
+	# Pattern that matches any tag not in the supported list
+	unsupported = re.compile(r'</?(?!(?:' + '|'.join(supported_tags) + r')\b)[^>]+>')
+
+	closing = [
+		(
+			re.compile(f'<{tag}>(.*?)(?=<(?:{"|".join(additional_tags)})>|$)', re.DOTALL),
+			f'<{tag}>\\1</{tag}>'
+		)
+		for tag in additional_tags
+	]
+	return unsupported, closing
+
+
+_shared_executor: Optional[ThreadPoolExecutor] = None
+_shared_executor_pid: Optional[int] = None
+
+
+def _get_shared_executor(default_workers: int) -> ThreadPoolExecutor:
+	"""
+	Return the process-wide executor used for TTS backend requests.
+
+	Sharing one executor across TextToSpeech instances avoids paying thread
+	pool setup and teardown on every conversion. The pool is sized from the
+	THREAD_POOL_SIZE environment variable when set, otherwise from
+	default_workers the first time it is needed.
+
+	The executor is tied to the process that created it: worker threads do
+	not survive a fork, so a child process (e.g. a generate_podcast_batch
+	worker) inheriting the parent's pool would submit work that never runs
+	and block forever on its results. A fresh pool is built whenever the
+	current pid differs from the creating one.
+
+	Args:
+		default_workers (int): Pool size to use when THREAD_POOL_SIZE is unset.
+
+	Returns:
+		ThreadPoolExecutor: The shared executor.
+	"""
+	global _shared_executor, _shared_executor_pid
+	if _shared_executor is None or _shared_executor_pid != os.getpid():
+		_shared_executor = ThreadPoolExecutor(
+			max_workers=int(os.getenv("THREAD_POOL_SIZE", default_workers))
+		)
+		_shared_executor_pid = os.getpid()
+	return _shared_executor
+
+
 class TextToSpeech:
 	def __init__(self, model: str = 'openai', api_key: Optional[str] = None):
 		"""
@@ -44,39 +143,119 @@ class TextToSpeech:
 		self.audio_format = self.tts_config['audio_format']
 		self.temp_audio_dir = self.tts_config['temp_audio_dir']
 		self.ending_message = self.tts_config['ending_message']
+		self.n_jobs = self.tts_config.get('n_jobs', 4)
+
+		# Decoded segments keyed by synthesis inputs, so converting a text
+		# again only re-synthesizes the turns that actually changed
+		self._tts_cache = {}
 
 		# Create temp_audio_dir if it doesn't exist
 		if not os.path.exists(self.temp_audio_dir):
 			os.makedirs(self.temp_audio_dir)
 
-	def __merge_audio_files(self, input_dir: str, output_file: str) -> None:
+	def __concatenate_segments(self, segments: Iterable["AudioSegment"]) -> "AudioSegment":
 		"""
-		Merge all audio files in the input directory sequentially and save the result.
+		Concatenate audio segments into a single segment in one pass.
+
+		Segments are consumed lazily, so concatenation of early segments
+		overlaps with synthesis of later ones when the input is a generator.
+		Raw PCM bytes are accumulated in a single growing buffer, avoiding
+		Pydub's __add__ path, which copies the entire accumulated audio on
+		every append (O(N^2) in total audio length). A segment whose audio
+		parameters differ from the running buffer is normalized to the
+		buffer's frame rate, sample width and channel count before its bytes
+		are appended, so only that segment is converted rather than the
+		whole accumulated audio.
 
 		Args:
-			input_dir (str): Path to the directory containing audio files.
-			output_file (str): Path to save the merged audio file.
+			segments (Iterable[AudioSegment]): Audio segments to concatenate, in order.
+
+		Returns:
+			AudioSegment: The concatenated audio.
 		"""
-		try:
-			# Function to sort filenames naturally
-			def natural_sort_key(filename: str) -> List[Union[int, str]]:
-				return [int(text) if text.isdigit() else text for text in re.split(r'(\d+)', filename)]
-			
-			combined = AudioSegment.empty()
-			audio_files = sorted(
-				[f for f in os.listdir(input_dir) if f.endswith(f".{self.audio_format}")],
-				key=natural_sort_key
-			)
-			for file in audio_files:
-				if file.endswith(f".{self.audio_format}"):
-					file_path = os.path.join(input_dir, file)
-					combined += AudioSegment.from_file(file_path, format=self.audio_format)
-			
-			combined.export(output_file, format=self.audio_format)
-			logger.info(f"Merged audio saved to {output_file}")
-		except Exception as e:
-			logger.error(f"Error merging audio files: {str(e)}")
-			raise
+		combined = None
+		raw = bytearray()
+		for segment in segments:
+			if combined is None:
+				combined = segment
+			elif (
+				segment.frame_rate != combined.frame_rate
+				or segment.sample_width != combined.sample_width
+				or segment.channels != combined.channels
+			):
+				# Parameters changed: resample just this segment to match
+				# the running buffer
+				segment = (
+					segment
+					.set_frame_rate(combined.frame_rate)
+					.set_sample_width(combined.sample_width)
+					.set_channels(combined.channels)
+				)
+			raw.extend(segment._data)
+
+		if combined is None:
+			return _pydub_audio_segment().empty()
+		return combined._spawn(bytes(raw))
+
+	def __decode_audio(self, raw_audio: bytes) -> "AudioSegment":
+		"""
+		Decode raw audio bytes returned by a TTS backend into an AudioSegment.
+
+		Args:
+			raw_audio (bytes): Encoded audio bytes as returned by the backend.
+
+		Returns:
+			AudioSegment: The decoded audio segment.
+		"""
+		return _pydub_audio_segment().from_file(io.BytesIO(raw_audio), format=self.audio_format)
+
+	def __synthesize_segments(self, items: List[Tuple[str, str]],
+							  generate_audio: Callable[[str, str], bytes]) -> Iterator["AudioSegment"]:
+		"""
+		Synthesize audio for a list of (voice, text) items, preserving order.
+
+		Up to n_jobs backend requests run concurrently. Results are yielded
+		in input order as soon as each becomes available, so the caller can
+		start stitching segment 0 while later segments are still being
+		synthesized.
+
+		Args:
+			items (List[Tuple[str, str]]): (voice, text) items to synthesize, in order.
+			generate_audio (Callable[[str, str], bytes]): Backend function taking
+				(text, voice) and returning encoded audio bytes.
+
+		Yields:
+			AudioSegment: Decoded audio segments, one per item, in input order.
+		"""
+		executor = _get_shared_executor(self.n_jobs)
+		pending = []
+		for voice, content in items:
+			key = self.__cache_key(content, voice)
+			segment = self._tts_cache.get(key)
+			if segment is not None:
+				pending.append((key, None, segment))
+			else:
+				pending.append((key, executor.submit(generate_audio, content, voice), None))
+
+		for key, future, segment in pending:
+			if segment is None:
+				segment = self.__decode_audio(future.result())
+				self._tts_cache[key] = segment
+			yield segment
+
+	def __cache_key(self, text: str, voice: str) -> str:
+		"""
+		Build a cache key identifying one synthesis request.
+
+		Args:
+			text (str): Text to convert to speech.
+			voice (str): Voice to use for the conversion.
+
+		Returns:
+			str: Hex digest covering the TTS service, model, voice and text.
+		"""
+		payload = "\x1f".join((self.model, self.tts_config[self.model]['model'], voice, text))
+		return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
 
 	def convert_to_speech(self, text: str, output_file: str) -> None:
 		"""
@@ -97,40 +276,78 @@ class TextToSpeech:
 		elif self.model == 'openai':
 			self.__convert_to_speech_openai(cleaned_text, output_file)
 
+	def __build_synthesis_items(self, qa_pairs: List[Tuple[str, str]],
+								default_voices: dict) -> List[Tuple[str, str]]:
+		"""
+		Flatten Q&A pairs into ordered (voice, text) synthesis items.
+
+		Consecutive turns spoken by the same voice are coalesced into a
+		single item, so they cost one backend request instead of one per
+		turn. With distinct question/answer voices this is a no-op.
+
+		Args:
+			qa_pairs (List[Tuple[str, str]]): (question, answer) dialogue pairs.
+			default_voices (dict): Mapping with 'question' and 'answer' voices.
+
+		Returns:
+			List[Tuple[str, str]]: (voice, text) items to synthesize, in order.
+		"""
+		flat = []
+		for question, answer in qa_pairs:
+			flat.append((default_voices['question'], question))
+			flat.append((default_voices['answer'], answer))
+
+		return [
+			(voice, " ".join(text for _, text in group))
+			for voice, group in itertools.groupby(flat, key=lambda item: item[0])
+		]
+
+	def __generate_audio_elevenlabs(self, text: str, voice: str) -> bytes:
+		"""
+		Generate audio for a piece of text using the ElevenLabs API.
+
+		Args:
+			text (str): Text to convert to speech.
+			voice (str): Voice to use for the conversion.
+
+		Returns:
+			bytes: Encoded audio bytes.
+		"""
+		audio = self.client.generate(
+			text=text,
+			voice=voice,
+			model=self.tts_config['elevenlabs']['model']
+		)
+		return b"".join(chunk for chunk in audio if chunk)
+
+	def __generate_audio_openai(self, text: str, voice: str) -> bytes:
+		"""
+		Generate audio for a piece of text using the OpenAI API.
+
+		Args:
+			text (str): Text to convert to speech.
+			voice (str): Voice to use for the conversion.
+
+		Returns:
+			bytes: Encoded audio bytes.
+		"""
+		response = openai.audio.speech.create(
+			model=self.tts_config['openai']['model'],
+			voice=voice,
+			input=text
+		)
+		return response.content
+
 	def __convert_to_speech_elevenlabs(self, text: str, output_file: str) -> None:
 		try:
 			qa_pairs = self.split_qa(text)
-			audio_files = []
-			counter = 0
-			for question, answer in qa_pairs:
-				question_audio = self.client.generate(
-					text=question,
-					voice=self.tts_config['elevenlabs']['default_voices']['question'],
-					model=self.tts_config['elevenlabs']['model']
-				)
-				answer_audio = self.client.generate(
-					text=answer,
-					voice=self.tts_config['elevenlabs']['default_voices']['answer'],
-					model=self.tts_config['elevenlabs']['model']
-				)
+			default_voices = self.tts_config['elevenlabs']['default_voices']
+
+			items = self.__build_synthesis_items(qa_pairs, default_voices)
+			segments = self.__synthesize_segments(items, self.__generate_audio_elevenlabs)
+			combined = self.__concatenate_segments(segments)
+			combined.export(output_file, format=self.audio_format)
 
-				# Save question and answer audio chunks
-				for audio in [question_audio, answer_audio]:
-					counter += 1
-					file_name = f"{self.temp_audio_dir}{counter}.{self.audio_format}"
-					with open(file_name, "wb") as out:
-						for chunk in audio:
-							if chunk:
-								out.write(chunk)
-					audio_files.append(file_name)
-
-			# Merge all audio files and save the result
-			self.__merge_audio_files(self.temp_audio_dir, output_file)
-
-			# Clean up individual audio files
-			for file in audio_files:
-				os.remove(file)
-			
 			logger.info(f"Audio saved to {output_file}")
 
 		except Exception as e:
@@ -140,33 +357,13 @@ class TextToSpeech:
 	def __convert_to_speech_openai(self, text: str, output_file: str) -> None:
 		try:
 			qa_pairs = self.split_qa(text)
-			print(qa_pairs)
-			audio_files = []
-			counter = 0
-			for question, answer in qa_pairs:
-				for speaker, content in [
-					(self.tts_config['openai']['default_voices']['question'], question),
-					(self.tts_config['openai']['default_voices']['answer'], answer)
-				]:
-					counter += 1
-					file_name = f"{self.temp_audio_dir}{counter}.{self.audio_format}"
-					response = openai.audio.speech.create(
-						model=self.tts_config['openai']['model'],
-						voice=speaker,
-						input=content
-					)
-					with open(file_name, "wb") as file:
-						file.write(response.content)
-
-					audio_files.append(file_name)
-
-			# Merge all audio files and save the result
-			self.__merge_audio_files(self.temp_audio_dir, output_file)
-
-			# Clean up individual audio files
-			for file in audio_files:
-				os.remove(file)
-			
+			default_voices = self.tts_config['openai']['default_voices']
+
+			items = self.__build_synthesis_items(qa_pairs, default_voices)
+			segments = self.__synthesize_segments(items, self.__generate_audio_openai)
+			combined = self.__concatenate_segments(segments)
+			combined.export(output_file, format=self.audio_format)
+
 			logger.info(f"Audio saved to {output_file}")
 
 		except Exception as e:
@@ -186,12 +383,9 @@ class TextToSpeech:
 		# Add ending message to the end of input_text
 		input_text += f"<Person2>{self.ending_message}</Person2>"
 
-		# Regular expression pattern to match Person1 and Person2 dialogues
-		pattern = r'<Person1>(.*?)</Person1>\s*<Person2>(.*?)</Person2>'
-		
 		# Find all matches in the input text
-		matches = re.findall(pattern, input_text, re.DOTALL)
-		
+		matches = _QA_PAIR_PATTERN.findall(input_text)
+
 		# Process the matches to remove extra whitespace and newlines
 		processed_matches = [
 			(
@@ -213,30 +407,17 @@ class TextToSpeech:
 		Returns:
 			str: Cleaned text with unsupported TSS markup tags removed.
 		"""
-		# List of SSML tags supported by both OpenAI and ElevenLabs
-		supported_tags = [
-			'speak', 'break', 'lang', 'p', 'phoneme',
-			's', 'say-as', 'sub'
-		]
-
-		# Append additional tags to the supported tags list
-		supported_tags.extend(additional_tags)
-
-		# Create a pattern that matches any tag not in the supported list
-		pattern = r'</?(?!(?:' + '|'.join(supported_tags) + r')\b)[^>]+>'
+		unsupported, closing = _markup_patterns(tuple(additional_tags))
 
 		# Remove unsupported tags
-		cleaned_text = re.sub(pattern, '', input_text)
+		cleaned_text = unsupported.sub('', input_text)
 
 		# Remove any leftover empty lines
-		cleaned_text = re.sub(r'\n\s*\n', '\n', cleaned_text)
+		cleaned_text = _EMPTY_LINES_PATTERN.sub('\n', cleaned_text)
 
 		# Ensure closing tags for additional tags are preserved
-		for tag in additional_tags:
-			cleaned_text = re.sub(f'<{tag}>(.*?)(?=<(?:{"|".join(additional_tags)})>|$)', 
-								  f'<{tag}>\\1</{tag}>', 
-								  cleaned_text, 
-								  flags=re.DOTALL)
+		for pattern, replacement in closing:
+			cleaned_text = pattern.sub(replacement, cleaned_text)
 
 		return cleaned_text.strip()
 
@@ -6,10 +6,56 @@ It uses environment variables to securely store and access API keys and other se
 and a YAML file for non-sensitive configuration settings.
 """
 
+import copy
+import functools
 import os
-from dotenv import load_dotenv, find_dotenv
 from typing import Any, Dict, Optional
-import yaml
+
+# Parsed YAML keyed by file path, so every Config instance shares one parse
+_yaml_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def _load_yaml_config(config_path: str) -> Dict[str, Any]:
+	"""
+	Load and cache the parsed YAML configuration file.
+
+	yaml is imported here rather than at module level so importing this
+	module stays cheap for callers that never construct a Config.
+
+	Args:
+		config_path (str): Path to the YAML configuration file.
+
+	Returns:
+		Dict[str, Any]: A copy of the parsed configuration, safe to mutate.
+	"""
+	if config_path not in _yaml_cache:
+		import yaml
+		try:
+			# The C loader parses YAML several times faster than the pure-Python one
+			from yaml import CSafeLoader as YamlLoader
+		except ImportError:
+			from yaml import SafeLoader as YamlLoader
+		with open(config_path, 'r') as file:
+			_yaml_cache[config_path] = yaml.load(file, Loader=YamlLoader)
+	return copy.deepcopy(_yaml_cache[config_path])
+
+
+@functools.lru_cache(maxsize=1)
+def _load_environment() -> None:
+	"""
+	Load variables from a .env file into the environment, once per process.
+
+	Set PODCASTFY_SKIP_DOTENV to skip the .env lookup entirely, e.g. in
+	deployments where configuration only comes from the environment.
+	"""
+	if os.getenv("PODCASTFY_SKIP_DOTENV"):
+		return
+	from dotenv import load_dotenv, find_dotenv
+	dotenv_path = find_dotenv(usecwd=True)
+	if dotenv_path:
+		load_dotenv(dotenv_path)
+	else:
+		print("Warning: .env file not found. Using environment variables if available.")
 
 def get_config_path(config_file: str = 'config.yaml'):
 	"""
@@ -45,13 +91,9 @@ class Config:
 		Args:
 			config_file (str): Path to the YAML configuration file. Defaults to 'config.yaml'.
 		"""
-		# Try to find .env file
-		dotenv_path = find_dotenv(usecwd=True)
-		if dotenv_path:
-			load_dotenv(dotenv_path)
-		else:
-			print("Warning: .env file not found. Using environment variables if available.")
-		
+		# Make sure .env variables are available (loaded once per process)
+		_load_environment()
+
 		# Load API keys from environment variables
 		self.JINA_API_KEY: str = os.getenv("JINA_API_KEY", "")
 		self.GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
@@ -60,8 +102,7 @@ class Config:
 		
 		config_path = get_config_path(config_file)
 		if config_path:
-			with open(config_path, 'r') as file:
-				self.config: Dict[str, Any] = yaml.safe_load(file)
+			self.config: Dict[str, Any] = _load_yaml_config(config_path)
 		else:
 			print("Could not locate config.yaml")
 			self.config = {}
@@ -74,10 +115,12 @@ class Config:
 		for key, value in self.config.items():
 			setattr(self, key.upper(), value)
 
-		# Ensure output directories exist
+		# Ensure output directories exist; skip the makedirs syscall when
+		# the directory is already there
 		if 'output_directories' in self.config:
 			for dir_type, dir_path in self.config['output_directories'].items():
-				os.makedirs(dir_path, exist_ok=True)
+				if not os.path.isdir(dir_path):
+					os.makedirs(dir_path, exist_ok=True)
 
 	def configure(self, **kwargs):
 		"""
@@ -110,10 +153,15 @@ class Config:
 		"""
 		return self.config.get(key, default)
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> Config:
 	"""
 	Load and return a Config instance.
 
+	The instance is memoized: every caller shares the same Config, so the
+	.env lookup and YAML parse happen once per process instead of on every
+	call. Instantiate Config() directly for an independent instance.
+
 	Returns:
 		Config: An instance of the Config class.
 	"""
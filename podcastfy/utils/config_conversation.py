@@ -8,7 +8,6 @@ for the Podcastfy application. It uses a YAML file for conversation-specific con
 import os
 import sys
 from typing import Any, Dict, Optional, List
-import yaml
 
 def get_conversation_config_path(config_file: str = 'conversation_config.yaml'):
 	"""
@@ -74,6 +73,7 @@ class ConversationConfig:
 
 	def _load_default_config(self) -> Dict[str, Any]:
 		"""Load the default configuration from conversation_config.yaml."""
+		import yaml
 		config_path = get_conversation_config_path()
 		if config_path:
 			with open(config_path, 'r') as file:
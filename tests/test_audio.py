@@ -1,8 +1,101 @@
+import io
 import unittest
 import os
+from pydub import AudioSegment
+
 from podcastfy.text_to_speech import TextToSpeech
 
 
+def _pcm_segment(data: bytes, frame_rate: int = 24000, sample_width: int = 2, channels: int = 1) -> AudioSegment:
+    """Build a short in-memory PCM segment from raw sample bytes."""
+    return AudioSegment(data=data, sample_width=sample_width, frame_rate=frame_rate, channels=channels)
+
+
+class TestAudioHelpers(unittest.TestCase):
+    """Unit tests for the audio processing helpers.
+
+    These cover the pure parts of the TTS pipeline (stitching, item
+    coalescing, caching) and need neither API keys nor ffmpeg: segments are
+    built from raw PCM and the synthesis stub round-trips through WAV.
+    """
+
+    def setUp(self):
+        self.tts = TextToSpeech(model="openai", api_key="test-key")
+        # WAV keeps encode/decode inside pydub, so no ffmpeg is needed
+        self.tts.audio_format = "wav"
+
+    def test_concatenate_matches_sequential_append(self):
+        segments = [
+            _pcm_segment(b"\x01\x00" * 200),
+            _pcm_segment(b"\x02\x00" * 300),
+            _pcm_segment(b"\x03\x00" * 100),
+        ]
+        expected = segments[0] + segments[1] + segments[2]
+
+        result = self.tts._TextToSpeech__concatenate_segments(iter(segments))
+
+        self.assertEqual(result.raw_data, expected.raw_data)
+        self.assertEqual(result.frame_rate, expected.frame_rate)
+        self.assertEqual(result.sample_width, expected.sample_width)
+        self.assertEqual(result.channels, expected.channels)
+
+    def test_concatenate_empty(self):
+        result = self.tts._TextToSpeech__concatenate_segments(iter([]))
+        self.assertEqual(len(result), 0)
+
+    def test_concatenate_normalizes_mismatched_segments(self):
+        base = _pcm_segment(b"\x01\x00" * 2400)
+        odd = _pcm_segment(b"\x02\x00" * 1200, frame_rate=12000)
+        expected = base + odd + base
+
+        result = self.tts._TextToSpeech__concatenate_segments(iter([base, odd, base]))
+
+        self.assertEqual(result.frame_rate, base.frame_rate)
+        self.assertEqual(result.raw_data, expected.raw_data)
+
+    def test_build_synthesis_items_preserves_alternating_voices(self):
+        qa_pairs = [("q1", "a1"), ("q2", "a2")]
+        voices = {"question": "echo", "answer": "shimmer"}
+
+        items = self.tts._TextToSpeech__build_synthesis_items(qa_pairs, voices)
+
+        self.assertEqual(
+            items,
+            [("echo", "q1"), ("shimmer", "a1"), ("echo", "q2"), ("shimmer", "a2")]
+        )
+
+    def test_build_synthesis_items_coalesces_same_voice_runs(self):
+        qa_pairs = [("q1", "a1"), ("q2", "a2")]
+        voices = {"question": "echo", "answer": "echo"}
+
+        items = self.tts._TextToSpeech__build_synthesis_items(qa_pairs, voices)
+
+        self.assertEqual(items, [("echo", "q1 a1 q2 a2")])
+
+    def test_synthesize_segments_caches_results(self):
+        calls = []
+
+        def fake_backend(text, voice):
+            calls.append((text, voice))
+            buffer = io.BytesIO()
+            _pcm_segment(b"\x01\x00" * 100).export(buffer, format="wav")
+            return buffer.getvalue()
+
+        items = [("echo", "hello"), ("shimmer", "world")]
+
+        first = list(self.tts._TextToSpeech__synthesize_segments(items, fake_backend))
+        self.assertEqual(len(first), 2)
+        self.assertEqual(calls, [("hello", "echo"), ("world", "shimmer")])
+
+        # Same items again: served from the cache, no new backend calls
+        second = list(self.tts._TextToSpeech__synthesize_segments(items, fake_backend))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(
+            [segment.raw_data for segment in second],
+            [segment.raw_data for segment in first]
+        )
+
+
 class TestAudio(unittest.TestCase):
     def setUp(self):
         self.test_text = "<Person1>Hello, how are you?</Person1><Person2>I'm doing great, thanks for asking!</Person2>"
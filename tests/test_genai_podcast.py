@@ -72,5 +72,42 @@ class TestGenAIPodcast(unittest.TestCase):
         # Check word count (allow some flexibility)
         word_count = len(result.split())
 
+    def test_generate_qa_content_batch(self):
+        """
+        Test that generate_qa_content_batch preserves input order and writes
+        each response to its output filepath, using a stubbed chain so no
+        model call is made.
+        """
+        content_generator = ContentGenerator.__new__(ContentGenerator)
+        content_generator.config_conversation = ConversationConfig()
+        content_generator.chain = MagicMock()
+        content_generator.chain.batch.side_effect = lambda prompt_params_list: [
+            f"<Person1>{params['input_text']}</Person1>" for params in prompt_params_list
+        ]
+
+        input_texts_list = ["first topic", "second topic", "third topic"]
+        expected = [f"<Person1>{input_texts}</Person1>" for input_texts in input_texts_list]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_filepaths = [
+                os.path.join(temp_dir, f"response_{i}.txt") for i in range(len(input_texts_list))
+            ]
+
+            results = content_generator.generate_qa_content_batch(input_texts_list, output_filepaths)
+
+            self.assertEqual(results, expected)
+
+            # All prompts went through a single chain.batch call, in input order
+            content_generator.chain.batch.assert_called_once()
+            prompt_params_list = content_generator.chain.batch.call_args[0][0]
+            self.assertEqual(
+                [params["input_text"] for params in prompt_params_list],
+                input_texts_list
+            )
+
+            for output_filepath, expected_content in zip(output_filepaths, expected):
+                with open(output_filepath, 'r') as file:
+                    self.assertEqual(file.read(), expected_content)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,7 @@
 import os
 import pytest
 import tempfile
-from podcastfy.client import generate_podcast
+from podcastfy.client import generate_podcast, generate_podcast_batch
 from podcastfy.utils.config import load_config
 from podcastfy.utils.config_conversation import load_conversation_config
 
@@ -94,6 +94,52 @@ def test_generate_podcast_with_custom_config(sample_config, sample_conversation_
 	assert audio_file.endswith('.mp3')
 	assert os.path.dirname(audio_file) == sample_config.get('output_directories', {}).get('audio')
 	
+def test_generate_podcast_batch_from_transcript_files(sample_config):
+	"""Test generating several podcasts in parallel from transcript files.
+
+	A podcast is generated in-process first so the batch also exercises
+	forked workers that inherit an already-warmed TTS thread pool.
+	"""
+	transcript_dir = sample_config.get('output_directories', {}).get('transcripts')
+	batch_requests = []
+	audio_dirs = []
+	for i in range(2):
+		transcript_file = os.path.join(transcript_dir, f'test_batch_transcript_{i}.txt')
+		with open(transcript_file, 'w') as f:
+			f.write(f"<Person1>Question number {i}</Person1><Person2>Answer number {i}</Person2>")
+
+		# One audio directory per request, so each result can be traced
+		# back to the request that produced it
+		audio_dir = os.path.join('tests/data/audio', f'batch_{i}')
+		os.makedirs(audio_dir, exist_ok=True)
+		audio_dirs.append(audio_dir)
+
+		batch_requests.append({
+			'transcript_file': transcript_file,
+			'config': {
+				'output_directories': {
+					'audio': audio_dir,
+					'transcripts': transcript_dir
+				}
+			}
+		})
+
+	# Warm the in-process TTS pool before forking
+	warmup_file = generate_podcast(
+		transcript_file=batch_requests[0]['transcript_file'],
+		config=sample_config
+	)
+	assert warmup_file is not None
+
+	results = generate_podcast_batch(batch_requests, pool_size=2)
+
+	assert len(results) == len(batch_requests)
+	for audio_file, audio_dir in zip(results, audio_dirs):
+		assert audio_file is not None
+		assert os.path.exists(audio_file)
+		assert audio_file.endswith('.mp3')
+		assert os.path.dirname(audio_file) == audio_dir
+
 def test_generate_podcast_no_urls_or_transcript():
 	"""Test that an error is raised when no URLs or transcript file is provided."""
 	with pytest.raises(ValueError):